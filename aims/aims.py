@@ -26,24 +26,81 @@
 """aims.py: Implements interface for working with ArcGIS REST API Map Services."""
 
 import os
+import warnings
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Tuple, Union
-from urllib.parse import urlparse
-
-from geopandas import GeoDataFrame
-from requests import get
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Any, Callable, Iterator, List, Tuple, Union
+from urllib.parse import urlparse, urlunparse
+
+import ijson
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import shapely
+from geopandas import GeoDataFrame, GeoSeries, points_from_xy
+from pyproj import CRS
+from requests import Session
+from requests.adapters import HTTPAdapter
+from shapely import STRtree
 from tqdm import tqdm
 from tqdm.contrib.concurrent import thread_map
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+# Prefer pyogrio, which writes through GDAL in bulk rather than feature by feature
+try:
+    import pyogrio
+
+    _IO_ENGINE = "pyogrio"
+
+except ImportError:
+    _IO_ENGINE = "fiona"
+
+# Geometry types that are requested as Esri JSON rather than GeoJSON
+_ESRI_JSON_TYPES = ("esriGeometryPoint", "esriGeometryPolyline", "esriGeometryPolygon")
+
+# Arrow types of ArcGIS field types
+_ARROW_TYPES = {
+    "esriFieldTypeOID": pa.int64(),
+    "esriFieldTypeSmallInteger": pa.int16(),
+    "esriFieldTypeInteger": pa.int32(),
+    "esriFieldTypeBigInteger": pa.int64(),
+    "esriFieldTypeSingle": pa.float32(),
+    "esriFieldTypeDouble": pa.float64(),
+    "esriFieldTypeString": pa.string(),
+    "esriFieldTypeDate": pa.int64(),
+    "esriFieldTypeGUID": pa.string(),
+    "esriFieldTypeGlobalID": pa.string(),
+}
+
+# pandas types of Arrow columns, keeping strings in Arrow memory & integers nullable
+_PANDAS_TYPES = {
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.string(): pd.ArrowDtype(pa.string()),
+}
+
+# Data is returned in WGS84 unless another output SR is requested
+_DEFAULT_CRS = CRS.from_epsg(4326)
+
+# (connect, read) timeout in seconds for requests made to the server
+_TIMEOUT = (10, 120)
 
 
 class AIMS:
-    def __init__(self, url: str, concurrent: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self, url: str, concurrent: bool = True, lazy: bool = False, **kwargs: Any
+    ) -> None:
         """
         Instantiates AIMS object.
 
         Args:
             url (str): Input ArcGIS REST API Map Service.
             concurrent (bool, optional): Determines whether or not to make requests concurrently. Defaults to True.
+            lazy (bool, optional): Determines whether or not to defer retrieving data until it is first accessed, only retrieving metadata upfront. Defaults to False.
         """
         # Validate URL
         self.url = self._validate_url(url)
@@ -60,6 +117,10 @@ class AIMS:
         self._query_outFields = kwargs.get("outFields", "*")
         self._query_outSR = kwargs.get("outSR", "")
 
+        # Set up session, with connection pool sized to the max number of workers
+        self._max_workers = kwargs.get("max_workers", 64)
+        self._session = self._create_session(self._max_workers)
+
         # Get metadata
         (
             self.n_records,
@@ -69,48 +130,401 @@ class AIMS:
             self.geometry_type,
         ) = self._get_metadata()
 
-        # Compile list of URL params
-        self._request_urls = [
-            (i, self.max_record_count)
-            for i in range(0, self.n_records, self.max_record_count)
-        ]
+        # Esri JSON is more compact than GeoJSON, and its coordinates can be handed
+        # to shapely in bulk, so it is requested for all supported geometry types
+        self._format = "json" if self.geometry_type in _ESRI_JSON_TYPES else "geojson"
+
+        # Retrieve data now, unless deferred until first accessed
+        self._concurrent = concurrent
+        self._uncompressed = False
+
+        if not lazy:
+            self.data = self._retrieve()
+
+    @cached_property
+    def data(self) -> dict:
+        """
+        Data as Esri JSON or GeoJSON, retrieved on instantiation (or first access, if lazy).
+
+        Returns:
+            dict: Features as Esri JSON (point, polyline, & polygon layers) or GeoJSON
+        """
+        return self._retrieve()
+
+    def _retrieve(self) -> dict:
+        """
+        Pages through the layer, retrieving all features.
+
+        Returns:
+            dict: Features as Esri JSON (point, polyline, & polygon layers) or GeoJSON
+        """
+        # Compile list of URL params, paging by OID ranges where possible, since
+        # servers execute offsets by skipping over all preceding rows
+        oid_chunks = self._get_oid_chunks()
+
+        if oid_chunks is not None:
+            # Only combine with the user's clause when there is one, as "()" is invalid
+            where = f"({self._query_where}) AND " if self._query_where.strip() else ""
+            request_urls = [
+                {
+                    "where": f"{where}{self._oid_field} >= {start} AND {self._oid_field} <= {end}"
+                }
+                for start, end in oid_chunks
+            ]
+
+        else:
+            request_urls = [
+                {"resultOffset": i, "resultRecordCount": self.max_record_count}
+                for i in range(0, self.n_records, self.max_record_count)
+            ]
 
         # Make requests concurrently or not
-        if concurrent:
-            # Removing ThreadPoolExecutor code & adding tqdm implementation/wrapper
-            # with ThreadPoolExecutor() as executor:
-            #     self._raw_responses = list(
-            #         executor.map(self._make_single_request, tqdm(self._request_urls))
-            #     )
-            self._raw_responses = thread_map(
-                self._make_single_request, self._request_urls
+        pages = self._fetch_all(request_urls, self._concurrent)
+
+        # Warn once for all pages, pointing at instantiation or the data property
+        if self._uncompressed:
+            warnings.warn(
+                "Server is not compressing responses, so retrieving data may be slow.",
+                stacklevel=3,
             )
 
-        else:
-            # Using normal map
-            self._raw_responses = list(
-                map(self._make_single_request, tqdm(self._request_urls))
+        # Spatial reference & fields are the same on every page, so keep the first
+        members = {
+            key: pages[0][key]
+            for key in ("spatialReference", "fields")
+            if pages and key in pages[0]
+        }
+
+        # With all data, combine, releasing the per-page lists once copied
+        features = list(chain.from_iterable(page["features"] for page in pages))
+        del pages
+
+        if len(features) != self.n_records:
+            warnings.warn(
+                f"Retrieved {len(features)} records, but {self.n_records} were expected."
             )
 
-        # With all data, combine
-        initial_json = self._raw_responses[0].json()
-        features = initial_json["features"]
+        if self._format == "json":
+            return {"geometryType": self.geometry_type, **members, "features": features}
+
+        return {"type": "FeatureCollection", "features": features}
+
+    @cached_property
+    def gdf(self) -> GeoDataFrame:
+        """
+        Data as GeoDataFrame, built (and retrieved, if lazy) on first access.
 
-        for resp in range(1, len(self._raw_responses)):
-            features += self._raw_responses[resp].json()["features"]
+        Returns:
+            GeoDataFrame: Features as GeoDataFrame
+        """
+        return self._build_gdf(self.data["features"], crs=self._crs)
 
-        self.data = initial_json
+    @cached_property
+    def _crs(self) -> CRS:
+        """
+        CRS of the data, resolved from the output SR.
 
-        # Convert to GDF
+        Returns:
+            CRS: CRS of the data
+        """
         if self._query_outSR != "":
-            self.gdf = GeoDataFrame.from_features(
-                self.data["features"], crs=self._query_outSR
+            return CRS.from_user_input(self._query_outSR)
+
+        return _DEFAULT_CRS
+
+    def _build_gdf(self, features: list, crs: CRS) -> GeoDataFrame:
+        """
+        Builds GeoDataFrame from features, constructing geometries in bulk.
+
+        Args:
+            features (list): Esri JSON or GeoJSON features
+            crs (CRS): CRS of the geometries
+
+        Returns:
+            GeoDataFrame: Features as GeoDataFrame
+        """
+        if self._format == "json":
+            properties = self._build_attributes(
+                [feature["attributes"] or {} for feature in features]
             )
+            geometries = [feature.get("geometry") for feature in features]
+
+            if self.geometry_type == "esriGeometryPoint":
+                geoms = self._build_points(geometries, crs)
+
+            elif self.geometry_type == "esriGeometryPolyline":
+                geoms = self._build_lines(geometries)
+
+            else:
+                geoms = self._build_polygons(geometries)
 
         else:
-            self.gdf = GeoDataFrame.from_features(self.data["features"], crs=4236)
+            properties = self._build_attributes(
+                [feature["properties"] or {} for feature in features]
+            )
+
+            geoms = shapely.from_geojson(
+                np.array(
+                    [
+                        orjson.dumps(feature["geometry"])
+                        if feature["geometry"]
+                        else None
+                        for feature in features
+                    ],
+                    dtype=object,
+                )
+            )
+
+        return GeoDataFrame(properties, geometry=GeoSeries(geoms, crs=crs))
+
+    def _build_attributes(self, records: list) -> pd.DataFrame:
+        """
+        Builds attribute table from Arrow columns, typed by the schema.
+
+        Columns are every field present in any record, in schema order. Values that
+        do not fit the field's type are inferred, or kept as strings if mixed.
+
+        Args:
+            records (list): Attributes of each feature
+
+        Returns:
+            pd.DataFrame: Attributes
+        """
+        field_types = {field["name"]: field["type"] for field in self.schema}
+        present = dict.fromkeys(chain.from_iterable(records))
+        names = [name for name in field_types if name in present]
+        names += [name for name in present if name not in field_types]
+        columns = {}
+
+        for name in names:
+            values = [record.get(name) for record in records]
+            arrow_type = _ARROW_TYPES.get(field_types.get(name))
+
+            try:
+                column = pa.array(values, type=arrow_type)
+
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                try:
+                    column = pa.array(values)
+
+                # Mixed types (e.g. numbers & strings, or lists) have no common type
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    column = pa.array(
+                        [None if value is None else str(value) for value in values],
+                        type=pa.string(),
+                    )
+
+            columns[name] = column
+
+        return pa.table(columns).to_pandas(types_mapper=_PANDAS_TYPES.get)
+
+    @staticmethod
+    def _point_coords(geometry: Union[dict, None]) -> Tuple[float, float]:
+        """
+        Extracts coordinates of an Esri JSON point, using NaN for empty geometries.
+
+        Args:
+            geometry (Union[dict, None]): Esri JSON point geometry
+
+        Returns:
+            Tuple[float, float]: X & Y coordinates
+        """
+        if not geometry or geometry.get("x") is None or geometry.get("y") is None:
+            return (np.nan, np.nan)
+
+        return (float(geometry["x"]), float(geometry["y"]))
+
+    @classmethod
+    def _build_points(cls, geometries: list, crs: CRS) -> np.ndarray:
+        """
+        Builds points from Esri JSON, with x & y copied straight into coordinate arrays.
+
+        Args:
+            geometries (list): Esri JSON point geometries
+            crs (CRS): CRS of the geometries
+
+        Returns:
+            np.ndarray: Points
+        """
+        coords = np.fromiter(
+            (cls._point_coords(geom) for geom in geometries),
+            dtype=np.dtype((np.float64, 2)),
+            count=len(geometries),
+        )
+        xs, ys = coords[:, 0], coords[:, 1]
+
+        geoms = points_from_xy(xs, ys, crs=crs)
+        geoms[np.isnan(xs) | np.isnan(ys)] = None
+
+        return geoms
+
+    @classmethod
+    def _build_lines(cls, geometries: list) -> np.ndarray:
+        """
+        Builds (multi)linestrings from Esri JSON paths.
+
+        Args:
+            geometries (list): Esri JSON polyline geometries
+
+        Returns:
+            np.ndarray: (Multi)linestrings
+        """
+        part_counts, part_sizes, coords = cls._flatten_parts(geometries, "paths")
+
+        lines = shapely.linestrings(
+            coords, indices=np.repeat(np.arange(len(part_sizes)), part_sizes)
+        )
+
+        return cls._combine_parts(lines, part_counts, shapely.multilinestrings)
+
+    @classmethod
+    def _build_polygons(cls, geometries: list) -> np.ndarray:
+        """
+        Builds (multi)polygons from Esri JSON rings.
+
+        Esri JSON shells are clockwise & holes counterclockwise, but rings are not
+        guaranteed to be ordered, so each hole is assigned to the smallest shell of
+        its feature that covers it. Holes without such a shell are treated as shells.
+
+        Args:
+            geometries (list): Esri JSON polygon geometries
+
+        Returns:
+            np.ndarray: (Multi)polygons
+        """
+        ring_counts, ring_sizes, coords = cls._flatten_parts(geometries, "rings")
+
+        rings = shapely.linearrings(
+            coords, indices=np.repeat(np.arange(len(ring_sizes)), ring_sizes)
+        )
+        ring_features = np.repeat(np.arange(len(ring_counts)), ring_counts)
+
+        # Index of the shell each ring belongs to, with shells belonging to themselves
+        ring_ids = np.arange(len(rings))
+        owners = ring_ids.copy()
+
+        is_ccw = shapely.is_ccw(rings)
+        shells, holes = np.flatnonzero(~is_ccw), np.flatnonzero(is_ccw)
+
+        if len(shells) and len(holes):
+            shell_polygons = shapely.polygons(rings[shells])
+
+            hole_idx, shell_idx = STRtree(shell_polygons).query(
+                rings[holes], predicate="covered_by"
+            )
+            shell_areas = shapely.area(shell_polygons)[shell_idx]
+            hole_idx, shell_idx = holes[hole_idx], shells[shell_idx]
+
+            # Only shells of the same feature, preferring the smallest (e.g. islands)
+            same = ring_features[hole_idx] == ring_features[shell_idx]
+            order = np.lexsort((shell_areas[same], hole_idx[same]))
+            hole_idx, shell_idx = hole_idx[same][order], shell_idx[same][order]
+
+            _, first = np.unique(hole_idx, return_index=True)
+            owners[hole_idx[first]] = shell_idx[first]
+
+        is_shell = owners == ring_ids
+
+        # Order rings as each shell followed by its holes
+        order = np.lexsort((~is_shell, owners))
+
+        polygons = shapely.polygons(
+            rings[order], indices=np.cumsum(is_shell[order]) - 1
+        )
+
+        polygon_counts = np.bincount(
+            ring_features[is_shell], minlength=len(ring_counts)
+        )
+
+        return cls._combine_parts(polygons, polygon_counts, shapely.multipolygons)
+
+    @staticmethod
+    def _flatten_parts(
+        geometries: list, key: str
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Flattens Esri JSON paths or rings of all geometries into a single coordinate array.
+
+        Args:
+            geometries (list): Esri JSON polyline or polygon geometries
+            key (str): Key of the parts, either "paths" or "rings"
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Number of parts per geometry, number of coordinates per part, & coordinates
+        """
+        parts = [geom[key] if geom and geom.get(key) else [] for geom in geometries]
+
+        part_counts = np.fromiter(map(len, parts), dtype=np.intp, count=len(parts))
+
+        parts = list(chain.from_iterable(parts))
+
+        part_sizes = np.fromiter(map(len, parts), dtype=np.intp, count=len(parts))
+        coords = np.array(list(chain.from_iterable(parts)), dtype=np.float64).reshape(
+            -1, 2
+        )
+
+        return part_counts, part_sizes, coords
+
+    @staticmethod
+    def _combine_parts(
+        parts: np.ndarray, part_counts: np.ndarray, multi: Callable
+    ) -> np.ndarray:
+        """
+        Combines parts into one geometry per feature, as a multipart geometry only when needed.
+
+        Args:
+            parts (np.ndarray): Single part geometries, in order of their features
+            part_counts (np.ndarray): Number of parts per feature
+            multi (Callable): Vectorized shapely constructor for the multipart geometry
+
+        Returns:
+            np.ndarray: Geometries, with None for features without parts
+        """
+        geoms = np.full(len(part_counts), None, dtype=object)
+
+        single = part_counts == 1
+        geoms[single] = parts[np.cumsum(part_counts)[single] - 1]
+
+        multipart = part_counts > 1
+        if multipart.any():
+            geoms[multipart] = multi(
+                parts[np.repeat(multipart, part_counts)],
+                indices=np.repeat(np.arange(multipart.sum()), part_counts[multipart]),
+            )
+
+        return geoms
 
     @staticmethod
+    def _create_session(pool_size: int) -> Session:
+        """
+        Creates session that reuses connections, retries failed requests, and accepts compressed responses.
+
+        Args:
+            pool_size (int): Number of connections to keep open per host.
+
+        Returns:
+            Session: Configured session
+        """
+        retry = Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+
+        session = Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # Ask for every compression scheme that can be decoded (incl. brotli if installed)
+        session.headers.update(
+            {"Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"]}
+        )
+
+        return session
+
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _validate_url(url: str) -> str:
         """
         Determines validity of URL and make corrections.
@@ -127,23 +541,24 @@ class AIMS:
         # Parse URL
         parsed = urlparse(url)
 
-        split_path = parsed.path.split("/")
+        segments = parsed.path.strip("/").split("/")
 
-        # Find layer number
-        for i in range(-1, -1 * len(split_path), -1):
-            try:
-                if isinstance(int(split_path[i]), int):
-                    if i + 1 == 0:
-                        return f"{parsed.scheme}://{parsed.netloc + '/'.join(split_path[:])}"
-                    else:
-                        return f"{parsed.scheme}://{parsed.netloc + '/'.join(split_path[: i + 1])}"
-            except:
-                pass
-
-        raise ValueError(
-            "Unable to validate URL. Should be URL of format: https://<ARCGIS_SERVER>/arcgis/rest/services/<FOLDER(S)>/MapServer/<LAYER_NUMBER>"
+        # Find layer number, searching from the end of the path
+        layer_index = next(
+            (i for i in range(len(segments) - 1, -1, -1) if segments[i].isdecimal()),
+            None,
         )
 
+        if layer_index is None:
+            raise ValueError(
+                "Unable to validate URL. Should be URL of format: https://<ARCGIS_SERVER>/arcgis/rest/services/<FOLDER(S)>/MapServer/<LAYER_NUMBER>"
+            )
+
+        # Drop anything following the layer number
+        path = "/" + "/".join(segments[: layer_index + 1])
+
+        return urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
+
     def to_shapefile(self, output_file: Union[str, os.PathLike]) -> None:
         """
         Exports data as shapefile.
@@ -151,16 +566,141 @@ class AIMS:
         Args:
             output_file (Union[str, os.PathLike]): File path of output, ending in extension "shp"
         """
-        self.gdf.to_file(output_file)
+        self.gdf.to_file(output_file, engine=_IO_ENGINE)
+
+    def to_parquet(self, output_file: Union[str, os.PathLike]) -> None:
+        """
+        Exports data as GeoParquet.
+
+        Args:
+            output_file (Union[str, os.PathLike]): File path of output, ending in extension "parquet"
+        """
+        self.gdf.to_parquet(output_file, engine="pyarrow", compression="zstd")
 
     def to_geojson(self, output_file: Union[str, os.PathLike]) -> None:
         """
         Exports data as GeoJSON.
 
+        Features are written directly from the retrieved data, only building the GeoDataFrame for polygons.
+
         Args:
             output_file (Union[str, os.PathLike]): File path of output, ending in extension "geojson"
         """
-        self.gdf.to_file(output_file, driver="GeoJSON")
+        with open(output_file, "wb") as file:
+            file.write(b'{"type":"FeatureCollection",')
+
+            # Record CRS when not the GeoJSON default of WGS84, if it has an EPSG code
+            epsg = self._crs.to_epsg()
+
+            if epsg is not None and epsg != 4326:
+                crs = {
+                    "type": "name",
+                    "properties": {"name": f"urn:ogc:def:crs:EPSG::{epsg}"},
+                }
+                file.write(b'"crs":' + orjson.dumps(crs) + b",")
+
+            file.write(b'"features":[')
+
+            for i, feature in enumerate(self._iter_geojson_features()):
+                if i:
+                    file.write(b",")
+
+                file.write(orjson.dumps(feature))
+
+            file.write(b"]}")
+
+    def to_geojsonseq(self, output_file: Union[str, os.PathLike]) -> None:
+        """
+        Exports data as GeoJSON Text Sequence (RFC 8142), with one feature per line.
+
+        Args:
+            output_file (Union[str, os.PathLike]): File path of output, ending in extension "geojsons"
+        """
+        with open(output_file, "wb") as file:
+            for feature in self._iter_geojson_features():
+                file.write(b"\x1e" + orjson.dumps(feature) + b"\n")
+
+    def _iter_geojson_features(self) -> Iterator[dict]:
+        """
+        Iterates over data as GeoJSON features, converting from Esri JSON if needed.
+
+        Yields:
+            Iterator[dict]: GeoJSON features
+        """
+        features = self.data["features"]
+
+        if self._format == "geojson":
+            yield from features
+            return
+
+        # Grouping rings into polygons needs their orientation, so polygons are
+        # serialized from the GeoDataFrame, which builds them in bulk
+        if self.geometry_type == "esriGeometryPolygon":
+            geometries = (
+                None if geom is None else orjson.Fragment(geom)
+                for geom in shapely.to_geojson(self.gdf.geometry.values)
+            )
+
+        else:
+            geometries = (
+                self._esri_to_geojson(feature.get("geometry")) for feature in features
+            )
+
+        for feature, geometry in zip(features, geometries):
+            yield {
+                "type": "Feature",
+                "geometry": geometry,
+                "properties": feature["attributes"],
+            }
+
+    @classmethod
+    def _esri_to_geojson(cls, geometry: Union[dict, None]) -> Union[dict, None]:
+        """
+        Converts an Esri JSON point or polyline to GeoJSON.
+
+        Args:
+            geometry (Union[dict, None]): Esri JSON point or polyline geometry
+
+        Returns:
+            Union[dict, None]: GeoJSON geometry, or None if empty
+        """
+        if not geometry:
+            return None
+
+        if "paths" in geometry:
+            paths = geometry["paths"]
+
+            if not paths:
+                return None
+
+            if len(paths) == 1:
+                return {"type": "LineString", "coordinates": paths[0]}
+
+            return {"type": "MultiLineString", "coordinates": paths}
+
+        x, y = cls._point_coords(geometry)
+
+        if np.isnan(x) or np.isnan(y):
+            return None
+
+        return {"type": "Point", "coordinates": [x, y]}
+
+    def _filter_params(self) -> dict:
+        """
+        Collects query params that determine which records are returned.
+
+        Returns:
+            dict: Query params
+        """
+        return {
+            "where": self._query_where,
+            "text": self._query_text,
+            "objectIds": self._query_objectIds,
+            "geometry": self._query_geometry,
+            "geometryType": self._query_geometryType,
+            "inSR": self._query_inSR,
+            "spatialRel": self._query_spatialRel,
+        }
 
     def _get_metadata(self) -> Tuple[int, int, dict, bool, str]:
         """
@@ -169,10 +709,26 @@ class AIMS:
         Returns:
             Tuple[int, int, dict, bool, str]: Total number of records (int), max record count (int), schema (dict), pagination support (bool), & geometry type (str)
         """
-        # Request metadata
-        metadata_response = get(self.url, params={"f": "json"})
+        # Request metadata & total record count at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            metadata_future = executor.submit(
+                self._session.get, self.url, params={"f": "json"}, timeout=_TIMEOUT
+            )
+            total_record_future = executor.submit(
+                self._session.get,
+                self.query_url,
+                params={
+                    **self._filter_params(),
+                    "returnCountOnly": "true",
+                    "f": "json",
+                },
+                timeout=_TIMEOUT,
+            )
 
-        metadata = metadata_response.json()
+            metadata = orjson.loads(metadata_future.result().content)
+            total_record_count = int(
+                orjson.loads(total_record_future.result().content)["count"]
+            )
 
         max_record_count = int(metadata["maxRecordCount"])
         supports_pagination = metadata["advancedQueryCapabilities"][
@@ -182,13 +738,6 @@ class AIMS:
 
         geometry_type = metadata["geometryType"]
 
-        # Find total record count via query
-        total_record_response = get(
-            self.query_url,
-            params={"returnCountOnly": "true", "where": "1=1", "f": "json"},
-        )
-        total_record_count = int(total_record_response.json()["count"])
-
         return (
             total_record_count,
             max_record_count,
@@ -197,30 +746,117 @@ class AIMS:
             geometry_type,
         )
 
-    def _make_single_request(self, pagination_params: tuple) -> None:
+    def _get_oid_chunks(self) -> Union[List[Tuple[int, int]], None]:
+        """
+        Splits OIDs of matching records into ranges that each fit in a single request.
+
+        Returns:
+            Union[List[Tuple[int, int]], None]: First & last OID of each range, or None if OIDs could not be retrieved
+        """
+        resp = self._session.get(
+            self.query_url,
+            params={**self._filter_params(), "returnIdsOnly": "true", "f": "json"},
+            timeout=_TIMEOUT,
+        )
+
+        if not resp.ok:
+            return None
+
+        # Proxies & some servers respond with HTML error pages instead
+        try:
+            ids_json = orjson.loads(resp.content)
+
+        except orjson.JSONDecodeError:
+            return None
+
+        # Servers without support respond with an error instead of OIDs
+        if "objectIds" not in ids_json or "objectIdFieldName" not in ids_json:
+            return None
+
+        self._oid_field = ids_json["objectIdFieldName"]
+        ids = sorted(ids_json["objectIds"] or [])
+
+        return [
+            (ids[i], ids[min(i + self.max_record_count, len(ids)) - 1])
+            for i in range(0, len(ids), self.max_record_count)
+        ]
+
+    def _fetch_all(self, request_urls: List[dict], concurrent: bool) -> List[dict]:
+        """
+        Makes all requests needed to page through data.
+
+        Args:
+            request_urls (List[dict]): URL params of each page
+            concurrent (bool): Determines whether or not to make requests concurrently.
+
+        Returns:
+            List[dict]: Each page, in order
+        """
+        if concurrent:
+            # Requests are I/O bound, so workers are sized to the number of pages
+            # rather than CPUs, with each reusing a connection from the session's pool
+            return thread_map(
+                self._make_single_request,
+                request_urls,
+                max_workers=max(1, min(len(request_urls), self._max_workers)),
+            )
+
+        # Using normal map
+        return list(map(self._make_single_request, tqdm(request_urls)))
+
+    def _make_single_request(self, pagination_params: dict) -> dict:
         """
         Makes a single request given a set of params for paginating through data.
 
+        Features are parsed as the response body streams in, rather than loading
+        the entire body into memory before parsing it.
+
         Args:
-            pagination_params (tuple): Offset and record count for pagination.
+            pagination_params (dict): OID range or offset and record count for pagination.
+
+        Raises:
+            ValueError: Server returned an error or an incomplete page
+
+        Returns:
+            dict: Page, with its features (Esri JSON or GeoJSON) & other members
         """
         # Set up params
         params = {
-            "where": self._query_where,
-            "text": self._query_text,
-            "geometry": self._query_geometry,
-            "geometryType": self._query_geometryType,
-            "inSR": self._query_inSR,
-            "spatialRel": self._query_spatialRel,
+            **self._filter_params(),
             "outFields": self._query_outFields,
             "outSR": self._query_outSR,
-            "resultOffset": pagination_params[0],
-            "resultRecordCount": pagination_params[1],
-            "f": "geojson",
+            "f": self._format,
+            **pagination_params,
         }
 
-        # Make request
-        resp = get(self.query_url, params=params)
+        # Unlike GeoJSON, Esri JSON is returned in the layer's native SR by default
+        if self._format == "json" and not self._query_outSR:
+            params["outSR"] = 4326
+
+        # Make request & parse features from stream
+        with self._session.get(
+            self.query_url, params=params, stream=True, timeout=_TIMEOUT
+        ) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+
+            # Recorded rather than warned here, so it is only reported once
+            if "Content-Encoding" not in resp.headers:
+                self._uncompressed = True
+
+            page = dict(ijson.kvitems(resp.raw, "", use_float=True))
+
+        # Errors are returned with a successful status code, so check the body
+        if "error" in page or "features" not in page:
+            raise ValueError(
+                f"Request for page failed: {page.get('error', 'no features returned')}"
+            )
+
+        # OID ranges fit within the max record count, so any truncation loses data
+        oid_paging = "resultOffset" not in pagination_params
+        if oid_paging and page.get("exceededTransferLimit"):
+            raise ValueError(
+                "Request for page exceeded the transfer limit, so records were dropped."
+            )
 
-        # Append data
-        return resp
+        return page
@@ -25,9 +25,8 @@
 
 """cli.py: Implements command line interface for using AIMS."""
 
-import json
-
 import click
+import orjson
 
 from aims import AIMS
 
@@ -39,11 +38,31 @@ from aims import AIMS
 @click.option("--out-fields", "-f", default="*", show_default=True)
 @click.option("--out-sr", "-crs", default="")
 @click.option("--geojson", "-gjs", type=click.Path(exists=False))
+@click.option("--geojsonseq", "-gjss", type=click.Path(exists=False))
 @click.option("--shapefile", "-shp", type=click.Path(exists=False))
+@click.option("--parquet", "-pq", type=click.Path(exists=False))
 @click.option("--schema", "-sc", type=click.Path(exists=False))
-def cli(url, concurrent, where, out_fields, out_sr, geojson, shapefile, schema) -> None:
-    # Instantiate AIMS object
-    instance = AIMS(url, concurrent, where=where, outFields=out_fields, outSR=out_sr)
+def cli(
+    url,
+    concurrent,
+    where,
+    out_fields,
+    out_sr,
+    geojson,
+    geojsonseq,
+    shapefile,
+    parquet,
+    schema,
+) -> None:
+    # Instantiate AIMS object, only retrieving data if it is to be exported
+    instance = AIMS(
+        url,
+        concurrent,
+        lazy=not (geojson or geojsonseq or shapefile or parquet),
+        where=where,
+        outFields=out_fields,
+        outSR=out_sr,
+    )
 
     if geojson:
         # Check file extension
@@ -59,6 +78,20 @@ def cli(url, concurrent, where, out_fields, out_sr, geojson, shapefile, schema)
         # Echo
         click.echo(f"GeoJSON saved at {out_gjs}")
 
+    if geojsonseq:
+        # Check file extension
+        if geojsonseq.lower().endswith(".geojsons"):
+            out_gjss = geojsonseq
+
+        else:
+            out_gjss = geojsonseq + ".geojsons"
+
+        # Export
+        instance.to_geojsonseq(out_gjss)
+
+        # Echo
+        click.echo(f"GeoJSON Text Sequence saved at {out_gjss}")
+
     if shapefile:
         # Check file extension
         if shapefile.lower().endswith(".shp"):
@@ -73,6 +106,20 @@ def cli(url, concurrent, where, out_fields, out_sr, geojson, shapefile, schema)
         # Echo
         click.echo(f"Shapefile saved at {out_shp}")
 
+    if parquet:
+        # Check file extension
+        if parquet.lower().endswith(".parquet"):
+            out_pq = parquet
+
+        else:
+            out_pq = parquet + ".parquet"
+
+        # Export
+        instance.to_parquet(out_pq)
+
+        # Echo
+        click.echo(f"GeoParquet saved at {out_pq}")
+
     if schema:
         # Check file extension
         if schema.lower().endswith(".json"):
@@ -83,7 +130,7 @@ def cli(url, concurrent, where, out_fields, out_sr, geojson, shapefile, schema)
 
         # Export
         with open(out_schema, "w") as file:
-            file.write(json.dumps(instance.schema))
+            file.write(orjson.dumps(instance.schema).decode())
 
         # Echo
         click.echo(f"Schema saved at {schema}")